@@ -4,10 +4,13 @@ __version__ = "1.0.4"
 __painterVersion__ = "10.1.2"
 
 import os
+import shutil
+import tempfile
+import importlib.util
 import subprocess
-import traceback
 import configparser
-from PIL import Image, UnidentifiedImageError
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 import substance_painter as sp
 from substance_painter.resource import Usage
@@ -15,15 +18,28 @@ from substance_painter.resource import Usage
 # Check for the Substance Painter version to determine the correct PySide version
 IsQt5 = sp.application.version_info() < (10, 1, 0)
 
-if IsQt5:
-    from PySide2 import QtWidgets
-    from PySide2.QtCore import Qt
-else:
-    from PySide6 import QtWidgets
-    from PySide6.QtCore import Qt
+# PySide modules, imported by load_qt() when the plugin starts
+QtWidgets = None
+Qt = None
+QTextCursor = None
 
 import substance_painter.ui
 
+def load_qt():
+    """
+    Import the PySide modules matching the running Substance Painter version.
+    Deferred to plugin start so scanning the plugin doesn't pull in QtWidgets.
+    """
+    global QtWidgets, Qt, QTextCursor
+    if IsQt5:
+        from PySide2 import QtWidgets
+        from PySide2.QtCore import Qt
+        from PySide2.QtGui import QTextCursor
+    else:
+        from PySide6 import QtWidgets
+        from PySide6.QtCore import Qt
+        from PySide6.QtGui import QTextCursor
+
 # Utility Functions
 
 def show_message_box(title, text):
@@ -58,77 +74,314 @@ def run_bcdecode(bcdecode_exe, input_dds, output_dds):
         "0",  # Specify face=0
         "2"   # Reconstruct normal map Z
     ]
-    result = subprocess.run(cmd, capture_output=True, text=True)
+    # stdout is only verbose progress, so discard it and report stderr through the error
+    result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
     if result.returncode != 0:
-        raise RuntimeError(f"bcdecode failed with code {result.returncode}\n{result.stderr}")
+        raise RuntimeError(f"bcdecode failed with code {result.returncode}\n{result.stderr.strip()}")
 
-def convert_dds_to_png(texconv_exe, dds_file, output_png):
+# Windows caps a command line at 32,767 characters, keep some margin below it
+COMMAND_LINE_MAX_LENGTH = 32000
+
+def convert_dds_batch(texconv_exe, dds_files, output_dir, fmt="tga", log_callback=log_to_painter_console):
     """
-    Convert a DDS file to PNG using texconv.
+    Convert several DDS files to TGA or PNG with as few texconv invocations as the command line allows.
 
     :param texconv_exe: Path to the texconv executable
-    :param dds_file: Path to the input DDS file
-    :param output_png: Path to the output PNG file
-    :raises RuntimeError: If the texconv command fails
+    :param dds_files: Paths to the input DDS files
+    :param output_dir: Directory the converted files are written to
+    :param fmt: Output file format, "tga" or "png"
+    :param log_callback: Called with each line of texconv output as it is produced
+    :return: Tuple of (dict mapping each input DDS file to the image texconv wrote for it,
+        dict mapping each input DDS file texconv failed to convert to its FAILED line)
+    :raises RuntimeError: If the texconv command fails without converting any file
     """
+    # texconv prints a "reading <input> (...)" line followed by a "writing <output>" line per file,
+    # and appends " FAILED (...)" to the line of the step that failed
+    inputs = {os.path.normcase(f): f for f in dds_files}
+    expected_outputs = {os.path.normcase(p): p for p in (texconv_output_path(f, output_dir, fmt) for f in dds_files)}
+    outputs = {}
+    failures = {}
+    tail = deque(maxlen=10)  # Last lines of output, kept for the error message
+    returncode = 0
     try:
         command = [
             texconv_exe,
-            "-ft", "png",  # Output format
-            "-o", os.path.dirname(output_png),  # Output directory
+            "-ft", fmt,  # Output format
+            "-o", output_dir,  # Output directory
             "-y",  # Overwrite existing files
-            dds_file  # Input DDS file
         ]
-        print(f"Running texconv command: {' '.join(command)}")
-        result = subprocess.run(command, capture_output=True, text=True)
+        # Large folders are split over several runs to stay under the command line length limit
+        for chunk in split_command_args(command, dds_files):
+            print(f"Running texconv command: {' '.join(command + chunk)}")
+            current = None
+            with subprocess.Popen(command + chunk, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, bufsize=1) as proc:
+                for line in proc.stdout:
+                    line = line.strip()
+                    log_callback(line)
+                    tail.append(line)
+                    # Only look for FAILED after the path, file names may contain it too
+                    if line.startswith("reading "):
+                        current, rest = match_texconv_path(line[len("reading "):], inputs)
+                    elif line.startswith("writing ") and current is not None:
+                        output_image, rest = match_texconv_path(line[len("writing "):], expected_outputs)
+                        if output_image is None:
+                            # Unexpected output name, keep it whole and let the split check it exists
+                            output_image, rest = line[len("writing "):], ""
+                        if "FAILED" not in rest:
+                            outputs[current] = output_image
+                            current = None
+                    else:
+                        rest = line
+                    if "FAILED" in rest:
+                        # texconv reports the failure and moves on to the next file
+                        if current is not None:
+                            failures[current] = line
+                        current = None
+            returncode = returncode or proc.returncode
+
+        # Files texconv wrote without a "writing" line we could match still land under their own stem
+        for dds_file in dds_files:
+            if dds_file not in outputs and dds_file not in failures:
+                output_image = texconv_output_path(dds_file, output_dir, fmt)
+                if os.path.exists(output_image):
+                    outputs[dds_file] = output_image
 
-        if result.returncode != 0:
-            raise RuntimeError(f"texconv failed with code {result.returncode}:\n{result.stderr.strip()}\n{result.stdout.strip()}")
+        # A non-zero exit code only means at least one file failed, keep the ones that converted
+        if returncode != 0 and not outputs:
+            raise RuntimeError(f"texconv failed with code {returncode}:\n" + "\n".join(tail))
 
+    except FileNotFoundError:
+        raise
     except Exception as e:
-        raise RuntimeError(f"Failed to convert {dds_file} to PNG: {e}")
+        raise RuntimeError(f"Failed to convert {', '.join(dds_files)} to {fmt.upper()}: {e}")
+
+    return outputs, failures
 
-def extract_alpha_channel(input_png, output_alpha_png):
+def split_command_args(command, args, max_length=COMMAND_LINE_MAX_LENGTH):
     """
-    Extract the alpha channel from a PNG file and save it as a separate PNG.
-    Returns True if an alpha channel was found and extracted, False otherwise.
+    Split arguments into chunks that each fit on one command line after the given command.
 
-    :param input_png: Path to the input PNG file
-    :param output_alpha_png: Path to the output alpha PNG file
-    :return: Boolean indicating if alpha was extracted
-    :raises RuntimeError: If extraction fails
+    :param command: Command and options shared by every chunk
+    :param args: Arguments to spread over the chunks
+    :param max_length: Maximum length of a command line
+    :return: Generator of argument lists, each with at least one argument
     """
-    try:
-        with Image.open(input_png) as img:
-            if img.mode in ("RGBA", "LA") or ("A" in img.getbands()):
-                alpha = img.getchannel("A")
-                alpha.save(output_alpha_png)
-                return True
-            return False
-    except UnidentifiedImageError as e:
-        raise RuntimeError(f"Failed to extract alpha channel from {input_png}: {e}")
+    base_length = len(subprocess.list2cmdline(command))
+    chunk = []
+    length = base_length
+    for arg in args:
+        arg_length = len(subprocess.list2cmdline([arg])) + 1
+        if chunk and length + arg_length > max_length:
+            yield chunk
+            chunk = []
+            length = base_length
+        chunk.append(arg)
+        length += arg_length
+    if chunk:
+        yield chunk
+
+def texconv_output_path(dds_file, output_dir, fmt):
+    """
+    Return the path texconv writes a converted DDS file to.
 
-def remove_alpha_channel(input_png):
+    :param dds_file: Path to the input DDS file
+    :param output_dir: Directory passed to texconv with -o
+    :param fmt: Output file format, "tga" or "png"
+    :return: Path of the converted image
+    """
+    return os.path.join(output_dir, os.path.splitext(os.path.basename(dds_file))[0] + "." + fmt)
+
+def match_texconv_path(text, paths):
+    """
+    Match the path at the start of a texconv output line against known paths.
+    Paths only match whole, so "tex.dds" doesn't claim "tex.dds (1).dds".
+
+    :param text: Line text following the "reading " or "writing " prefix
+    :param paths: Dict mapping normalized paths to the values to return
+    :return: Tuple of (matched value, text following the path), or (None, text) if nothing matches
     """
-    Remove the alpha channel from a PNG file.
+    normalized = os.path.normcase(text)
+    # The longest match wins, as a path followed by a space can also be the start of a longer one
+    for key in sorted(paths, key=len, reverse=True):
+        if normalized == key or normalized.startswith(key + " "):
+            return paths[key], text[len(key):]
+    return None, text
+
+# FourCCs of the block-compressed formats Pillow's built-in DDS decoder handles
+BCN_FOURCCS = {b"DXT1", b"DXT3", b"DXT5", b"ATI1", b"BC4U", b"ATI2", b"BC5U"}
+
+# DXGI_FORMAT_BC5_SNORM, found in the DX10 extended header
+DXGI_FORMAT_BC5_SNORM = 84
+
+# DXGI formats with more than 8 bits per channel: 32/16/10-bit, depth, shared exponent and BC6H
+DXGI_HIGH_BIT_DEPTH_FORMATS = set(range(1, 27)) | set(range(33, 48)) | set(range(53, 60)) | {67, 89, 94, 95, 96}
+
+# Legacy headers store these D3DFMT values as a numeric FourCC: A16B16G16R16, Q16W16V16U16 and the float formats
+D3DFMT_HIGH_BIT_DEPTH_FOURCCS = {n.to_bytes(4, "little") for n in (36, 110, 111, 112, 113, 114, 115, 116)}
+
+# DDS_PIXELFORMAT flag set when the format is given by the FourCC rather than channel masks
+DDPF_FOURCC = 0x4
 
-    :param input_png: Path to the input PNG file
-    :raises RuntimeError: If removal fails
+def read_dds_format(dds_file):
     """
+    Read the pixel format of a DDS file from its header.
+
+    :param dds_file: Path to the DDS file
+    :return: Tuple of (FourCC, DXGI format or None, widest channel mask in bits or None),
+        or (None, None, None) if the file is not a DDS file
+    """
+    with open(dds_file, "rb") as f:
+        header = f.read(148)
+    if len(header) < 108 or header[:4] != b"DDS ":
+        return None, None, None
+    fourcc = header[84:88]
+    # Uncompressed legacy formats describe each channel with a bit mask instead
+    mask_bits = None
+    if not int.from_bytes(header[80:84], "little") & DDPF_FOURCC:
+        masks = (int.from_bytes(header[offset:offset + 4], "little") for offset in range(92, 108, 4))
+        mask_bits = max(bin(mask).count("1") for mask in masks)
+    if fourcc == b"DX10" and len(header) >= 132:
+        return fourcc, int.from_bytes(header[128:132], "little"), mask_bits
+    return fourcc, None, mask_bits
+
+def is_bc5_snorm(fourcc, dxgi_format):
+    """Return True if a DDS pixel format is BC5_SNORM, which needs bcdecode to reconstruct Z."""
+    return fourcc == b"BC5S" or dxgi_format == DXGI_FORMAT_BC5_SNORM
+
+def is_high_bit_depth(fourcc, dxgi_format, mask_bits):
+    """Return True if a DDS pixel format has more than 8 bits per channel, which TGA can't hold."""
+    return (
+        dxgi_format in DXGI_HIGH_BIT_DEPTH_FORMATS
+        or fourcc in D3DFMT_HIGH_BIT_DEPTH_FOURCCS
+        or (mask_bits or 0) > 8
+    )
+
+# Intermediate image formats, uncompressed TGA is the fastest to write
+OUTPUT_FORMATS = ("tga", "png")
+
+# The PNGs are intermediate shelf resources, so favour encode speed over file size
+PNG_SAVE_OPTIONS = {"compress_level": 1, "optimize": False}
+
+def save_options(path):
+    """Return the Pillow save options for an intermediate image, based on its extension."""
+    return PNG_SAVE_OPTIONS if path.lower().endswith(".png") else {}
+
+# Block rows handed to each worker when decoding large BCn textures (8 block rows = 32 pixel rows)
+BCN_SLAB_BLOCK_ROWS = 8
+
+# Textures shorter than this decode faster in one pass than with the slab thread pool
+BCN_MT_MIN_HEIGHT = 1024
+
+def decode_bcn_mt(img, f, num_threads=None):
+    """
+    Decode the top mip level of an opened BCn DDS image, splitting it into horizontal
+    slabs of 4x4 block rows decoded on a thread pool. Pillow releases the GIL while
+    decoding, and slabs never overlap, so workers need no synchronisation.
+
+    :param img: DDS image opened with Pillow, not yet loaded
+    :param f: Binary file object of the DDS file
+    :param num_threads: Number of worker threads, defaults to the CPU count
+    :return: Decoded image
+    """
+    from PIL import Image
+
+    decoder_name, _, offset, args = img.tile[0][:4]
+    if not isinstance(args, tuple):
+        args = (args,)
+    width, height = img.size
+    block_size = 8 if args[0] in (1, 4) else 16  # BC1 and BC4 use 8-byte blocks
+    row_bytes = ((width + 3) // 4) * block_size
+    block_rows = (height + 3) // 4
+
+    f.seek(offset)
+    data = f.read(block_rows * row_bytes)
+
+    def decode_slab(block_row):
+        rows = min(BCN_SLAB_BLOCK_ROWS, block_rows - block_row)
+        top = block_row * 4
+        chunk = data[block_row * row_bytes:(block_row + rows) * row_bytes]
+        return top, Image.frombytes(img.mode, (width, min(rows * 4, height - top)), chunk, decoder_name, *args)
+
+    result = Image.new(img.mode, img.size)
+    with ThreadPoolExecutor(max_workers=num_threads or os.cpu_count() or 1) as executor:
+        for top, slab in executor.map(decode_slab, range(0, block_rows, BCN_SLAB_BLOCK_ROWS)):
+            result.paste(slab, (0, top))
+    return result
+
+def decode_bcn(dds_file, output_image, output_alpha_image, num_threads=1):
+    """
+    Decode a BC1-BC5 DDS file in-process with Pillow, without launching texconv, and save it
+    split into RGB and alpha images straight from the decoded pixels.
+
+    :param dds_file: Path to the input DDS file
+    :param output_image: Path to the output image, its extension selects the format
+    :param output_alpha_image: Path to the output alpha image file
+    :param num_threads: Threads available to decode large textures in slabs, 1 decodes in one pass
+    :return: Same as save_split_rgba
+    :raises RuntimeError: If decoding fails
+    """
+    from PIL import Image, UnidentifiedImageError
+
     try:
-        with Image.open(input_png) as img:
-            if img.mode == "RGBA":
-                rgb_image = img.convert("RGB")
-                rgb_image.save(input_png)
+        with open(dds_file, "rb") as f, Image.open(f) as img:
+            # Large textures are decoded slab by slab on several threads
+            if num_threads > 1 and len(img.tile) == 1 and img.tile[0][0] == "bcn" and img.size[1] >= BCN_MT_MIN_HEIGHT:
+                return save_split_rgba(decode_bcn_mt(img, f, num_threads), output_image, output_alpha_image)
+            img.load()
+            return save_split_rgba(img, output_image, output_alpha_image)
+    except (UnidentifiedImageError, NotImplementedError, OSError, ValueError) as e:
+        raise RuntimeError(f"Failed to decode {dds_file}: {e}")
+
+def save_split_rgba(img, output_image, output_alpha_image):
+    """
+    Save a decoded image as an RGB image and a separate alpha image. Both outputs come
+    from the same loaded pixels, so the source is never decoded twice.
+    Returns True if an alpha channel was found and extracted, False if it was fully
+    opaque and skipped, and None if the image has no alpha channel.
+
+    :param img: Loaded Pillow image
+    :param output_image: Path to the output image file, written without alpha
+    :param output_alpha_image: Path to the output alpha image file
+    :return: True if alpha was extracted, False if it was opaque, None if absent
+    """
+    if "A" not in img.getbands():
+        img.save(output_image, **save_options(output_image))
+        return None
+    alpha = img.getchannel("A")
+    lo, _ = alpha.getextrema()
+    if lo < 255:
+        alpha.save(output_alpha_image, **save_options(output_alpha_image))
+    img.convert("RGB").save(output_image, **save_options(output_image))
+    return lo < 255
+
+def split_rgba(input_image, output_alpha_image):
+    """
+    Split an image file into an RGB image and a separate alpha image, decoding it only once.
+    The input file is overwritten with its RGB channels when an alpha channel is present.
+
+    :param input_image: Path to the input TGA or PNG file
+    :param output_alpha_image: Path to the output alpha image file
+    :return: Same as save_split_rgba
+    :raises RuntimeError: If the split fails
+    """
+    from PIL import Image, UnidentifiedImageError
+
+    try:
+        with Image.open(input_image) as img:
+            if img.mode == "RGB" or "A" not in img.getbands():
+                return None
+            # Load once so getchannel and convert share the decoded pixels
+            img.load()
+            return save_split_rgba(img, input_image, output_alpha_image)
     except UnidentifiedImageError as e:
-        raise RuntimeError(f"Failed to remove alpha channel from {input_png}: {e}")
+        raise RuntimeError(f"Failed to split alpha channel from {input_image}: {e}")
 
 # Main Plugin Class
 
 class DDSImporterPlugin:
     """
     A plugin to handle importing DDS files and BC5_SNORM DDS files into Substance Painter.
-    Converts DDS textures to PNG using texconv and handles BC5_SNORM using bcdecode.
+    Converts DDS textures to TGA or PNG using texconv and handles BC5_SNORM using bcdecode.
     """
     CONFIG_FILE = os.path.join(os.path.dirname(__file__), "DDS-Importer.ini")
 
@@ -143,10 +396,11 @@ class DDSImporterPlugin:
         # Log window
         self.log_window = QtWidgets.QTextEdit()
         self.log_window.setReadOnly(True)
+        self._log_cursor = self.log_window.textCursor()
         layout.addWidget(self.log_window)
 
         # DDS Section
-        self.dds_group = QtWidgets.QGroupBox("Import DDS files to session resources as png")
+        self.dds_group = QtWidgets.QGroupBox("Import DDS files to session resources")
         dds_layout = QtWidgets.QVBoxLayout()
         self.import_dds_btn = QtWidgets.QPushButton("Import")
         dds_layout.addWidget(self.import_dds_btn)
@@ -191,7 +445,9 @@ class DDSImporterPlugin:
         # Add the plugin window as a dockable widget in Substance Painter
         substance_painter.ui.add_dock_widget(self.window)
 
-        # Load configuration
+        # Load configuration, which also fills the executable cache
+        self._texconv_exe = None
+        self._bcdecode_exe = None
         self.config = configparser.ConfigParser()
         self.load_config()
 
@@ -202,10 +458,10 @@ class DDSImporterPlugin:
         self.check_pillow_installation()
 
     def check_pillow_installation(self):
-        try:
-            import PIL
+        # Only look up the package so Pillow itself is imported on first use
+        if importlib.util.find_spec("PIL") is not None:
             self.log("Pillow installed: Yes")
-        except ImportError:
+        else:
             self.log("Pillow installed: No")
             self.log("To install Pillow:")
             self.log("1. Open the Windows Command Prompt (type 'cmd' in the Windows search bar and press Enter).")
@@ -213,8 +469,8 @@ class DDSImporterPlugin:
             self.log("\"C:\\Program Files\\Adobe\\Adobe Substance 3D Painter\\resources\\pythonsdk\\python.exe\" -m pip install Pillow")
 
     def display_initial_info(self):
-        texconv_path = self.config["Paths"].get("texconv", "Not set")
-        bcdecode_path = self.config["Paths"].get("bcdecode", "Not set")
+        texconv_path = self._texconv_exe or "Not found"
+        bcdecode_path = self._bcdecode_exe or "Not found"
         self.log(f"texconv location: {texconv_path}")
         self.log(f"bcdecode location: {bcdecode_path}")
 
@@ -223,6 +479,27 @@ class DDSImporterPlugin:
         self.log_window.append(message)
         log_to_painter_console(message)
 
+    def _log_batch(self, lines):
+        """Log several messages at once, laying out the log window a single time."""
+        self.log_window.setUpdatesEnabled(False)
+        try:
+            for line in lines:
+                self._log_cursor.movePosition(QTextCursor.End)
+                if not self.log_window.document().isEmpty():
+                    self._log_cursor.insertBlock()
+                self._log_cursor.insertText(line)
+                log_to_painter_console(line)
+        finally:
+            self.log_window.setUpdatesEnabled(True)
+        self.log_window.setTextCursor(self._log_cursor)
+        self.log_window.ensureCursorVisible()
+
+    def print_traceback(self, exc):
+        """Print the traceback of an exception to the console, only when verbose logging is enabled."""
+        if self.config.getboolean("Options", "verbose", fallback=False):
+            import traceback
+            traceback.print_exception(type(exc), exc, exc.__traceback__)
+
     def toggle_log_visibility(self):
         """Toggle the visibility of the log window."""
         self.log_window.setVisible(not self.log_window.isVisible())
@@ -237,12 +514,43 @@ class DDSImporterPlugin:
             self.create_default_config()
         self.config.read(self.CONFIG_FILE)
 
+        # Cache the executables that exist so import clicks don't hit the filesystem
+        self._texconv_exe = self._resolve_exe("texconv", "texconv")
+        self._bcdecode_exe = self._resolve_exe("bcdecode", "bcdecode")
+
+    def output_format(self):
+        """Return the configured intermediate image format, falling back to TGA if it is invalid."""
+        fmt = self.config.get("Options", "output_format", fallback="tga").lower()
+        return fmt if fmt in OUTPUT_FORMATS else "tga"
+
+    def _resolve_exe(self, key, default_name):
+        """
+        Resolve an executable from its configured path, falling back to a lookup on PATH.
+
+        :param key: Key of the executable in the [Paths] section
+        :param default_name: Executable name to search for on PATH
+        :return: Path to the executable, or None if it can't be found
+        """
+        configured = self.config["Paths"].get(key, None)
+        if configured and os.path.isfile(configured):
+            return configured
+        resolved = shutil.which(default_name)
+        if resolved:
+            self.log(f"{key} not found at configured location, using {resolved} from PATH")
+        else:
+            self.log(f"{key} not found at configured location ({configured or 'not set'}) or on PATH")
+        return resolved
+
     def create_default_config(self):
         """Create a default configuration file."""
         self.config["Paths"] = {
             "texconv": r"C:\\DirectXTex\\Texconv\\texconv.exe",
             "bcdecode": r"C:\\fo76utils\\bcdecode.exe"
         }
+        self.config["Options"] = {
+            "output_format": "tga",
+            "verbose": "false"
+        }
         self.save_config()
 
     def save_config(self):
@@ -262,6 +570,7 @@ class DDSImporterPlugin:
         )
         if texconv_path:
             self.config["Paths"]["texconv"] = texconv_path
+            self._texconv_exe = texconv_path
             self.save_config()
             self.log(f"texconv location set to: {texconv_path}")
         else:
@@ -276,6 +585,7 @@ class DDSImporterPlugin:
         )
         if bcdecode_path:
             self.config["Paths"]["bcdecode"] = bcdecode_path
+            self._bcdecode_exe = bcdecode_path
             self.save_config()
             self.log(f"bcdecode location set to: {bcdecode_path}")
         else:
@@ -283,7 +593,7 @@ class DDSImporterPlugin:
 
     def on_import_dds(self):
         """
-        Handle the import DDS button click event to convert DDS textures to PNG.
+        Handle the import DDS button click event to convert DDS textures to TGA or PNG.
         """
         # Open file dialog to select DDS files
         dds_files, _ = QtWidgets.QFileDialog.getOpenFileNames(
@@ -295,38 +605,212 @@ class DDSImporterPlugin:
             self.log("No DDS files selected for import.")
             return
 
-        texconv_exe = self.config["Paths"].get("texconv", None)
-
-        # Check if texconv is valid
-        if not texconv_exe or not os.path.isfile(texconv_exe):
-            self.log("Invalid or missing texconv executable. Please set it using the 'Set texconv Location' button.")
-            return
+        bcdecode_exe = self._bcdecode_exe
 
+        # Common BCn formats are decoded in-process, BC5_SNORM is reconstructed by bcdecode
+        # first, and everything else goes straight through texconv
+        bcn_files = []
+        bc5_snorm_files = []
+        texconv_files = []
+        high_bit_depth_files = set()
         for dds_file in dds_files:
             try:
-                output_png = os.path.splitext(dds_file)[0] + ".png"
-                output_alpha_png = os.path.splitext(dds_file)[0] + "_alpha.png"
+                fourcc, dxgi_format, mask_bits = read_dds_format(dds_file)
+            except OSError:
+                fourcc, dxgi_format, mask_bits = None, None, None
+            if is_bc5_snorm(fourcc, dxgi_format):
+                if bcdecode_exe:
+                    bc5_snorm_files.append(dds_file)
+                else:
+                    self.log(f"{dds_file} is BC5_SNORM but bcdecode is not set, converting without Z reconstruction.")
+                    texconv_files.append(dds_file)
+            elif fourcc in BCN_FOURCCS:
+                bcn_files.append(dds_file)
+            else:
+                texconv_files.append(dds_file)
+                if is_high_bit_depth(fourcc, dxgi_format, mask_bits):
+                    high_bit_depth_files.add(dds_file)
+
+        texconv_exe = self._texconv_exe
+        fmt = self.output_format()
+
+        # Check if texconv is valid, without it only the in-process BCn files can be imported
+        if (texconv_files or bc5_snorm_files) and not texconv_exe:
+            self.log("Invalid or missing texconv executable. Please set it using the 'Set texconv Location' button.")
+            for dds_file in texconv_files + bc5_snorm_files:
+                self.log(f"Skipped {dds_file}: converting it requires texconv.")
+            texconv_files, bc5_snorm_files = [], []
+            if not bcn_files:
+                return
+
+        # Convert and split files in parallel; shelf imports stay on the main thread
+        # since the Substance Painter API is not thread-safe
+        max_workers = min(os.cpu_count() or 1, len(dds_files))
+        with tempfile.TemporaryDirectory() as temp_dir, ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # Share the cores left over by the file-level pool with the slab decoder, so
+            # batches don't nest a full thread pool inside every worker
+            slab_threads = max(1, (os.cpu_count() or 1) // len(dds_files))
+            bcn_futures = [executor.submit(self._decode_one, dds_file, fmt, slab_threads) for dds_file in bcn_files]
+
+            # Decoded BC5_SNORM files keep their name in a per-file temp folder, so texconv
+            # still writes the output next to the original DDS
+            decode_futures = {}
+            for index, dds_file in enumerate(bc5_snorm_files):
+                decoded_dds = os.path.join(temp_dir, str(index), os.path.basename(dds_file))
+                os.makedirs(os.path.dirname(decoded_dds))
+                self.log(f"Detected BC5_SNORM, running bcdecode on {dds_file}...")
+                decode_futures[executor.submit(run_bcdecode, bcdecode_exe, dds_file, decoded_dds)] = (dds_file, decoded_dds)
+
+            # texconv writes every output into a single directory, so batch the files per folder.
+            # These batches start right away, alongside the in-process decodes
+            groups = {}
+            for dds_file in texconv_files:
+                # TGA only holds 8 bits per channel, so wider formats are always written as PNG
+                file_fmt = "png" if dds_file in high_bit_depth_files else fmt
+                groups.setdefault((os.path.dirname(dds_file), file_fmt), {})[dds_file] = dds_file
+            batch_futures = {}
+            self._submit_batches(executor, texconv_exe, groups, batch_futures)
+
+            # Files Pillow fails to decode in-process fall back to texconv when it is available,
+            # together with the bcdecode outputs in a second round of batches
+            groups = {}
+            futures = []
+            for future in as_completed(bcn_futures):
+                dds_file, _, _, _, exc = future.result()
+                if exc is not None and texconv_exe:
+                    self.log(f"In-process decode failed for {dds_file}, falling back to texconv: {exc}")
+                    groups.setdefault((os.path.dirname(dds_file), fmt), {})[dds_file] = dds_file
+                else:
+                    futures.append(future)
+
+            for future in as_completed(decode_futures):
+                dds_file, decoded_dds = decode_futures[future]
+                try:
+                    future.result()
+                except Exception as e:
+                    if isinstance(e, FileNotFoundError):
+                        self._bcdecode_exe = None
+                    self.log(f"Failed to process {dds_file}: {e}")
+                    self.print_traceback(e)
+                    continue
+                groups.setdefault((os.path.dirname(dds_file), fmt), {})[decoded_dds] = dds_file
+            self._submit_batches(executor, texconv_exe, groups, batch_futures)
+
+            for future in as_completed(batch_futures):
+                group = batch_futures[future]
+                try:
+                    outputs, failures = future.result()
+                except Exception as e:
+                    if isinstance(e, FileNotFoundError):
+                        self._texconv_exe = None
+                    for dds_file in group.values():
+                        self.log(f"Failed to process {dds_file}: {e}")
+                    self.print_traceback(e)
+                    continue
+                for texconv_input, dds_file in group.items():
+                    if texconv_input in failures:
+                        self.log(f"Failed to process {dds_file}: {failures[texconv_input]}")
+                        continue
+                    split_alpha = dds_file not in high_bit_depth_files
+                    futures.append(executor.submit(self._process_one, dds_file, outputs.get(texconv_input), split_alpha))
+
+            shelf_queue = []
+            for future in as_completed(futures):
+                dds_file, output_image, output_alpha_image, log_lines, exc = future.result()
+                self._log_batch(log_lines)
+
+                if exc is not None:
+                    self.log(f"Failed to process {dds_file}: {exc}")
+                    self.print_traceback(exc)
+                    continue
+
+                # Queue the image(s) for the Substance Painter shelf
+                shelf_queue.append(output_image)
+                if output_alpha_image:
+                    shelf_queue.append(output_alpha_image)
+
+        self.import_batch_to_shelf(shelf_queue)
+
+    def _submit_batches(self, executor, texconv_exe, groups, batch_futures):
+        """
+        Submit one texconv batch per output folder and format.
 
-                # Convert directly to PNG via texconv
-                self.log(f"Converting {dds_file} to PNG directly using texconv...")
-                convert_dds_to_png(texconv_exe, dds_file, output_png)
+        :param executor: Executor the batches run on
+        :param texconv_exe: Path to the texconv executable
+        :param groups: Dict mapping each (output folder, format) pair to a dict of texconv input -> original DDS file
+        :param batch_futures: Dict the submitted futures are added to, mapped to their group
+        """
+        for (output_dir, fmt), group in groups.items():
+            self.log(f"Converting {len(group)} file(s) in {output_dir} to {fmt.upper()} using texconv...")
+            # texconv output streams to the console, as the log window can't be updated off the main thread
+            batch_futures[executor.submit(convert_dds_batch, texconv_exe, list(group), output_dir, fmt)] = group
 
-                # Extract alpha channel if present
-                if extract_alpha_channel(output_png, output_alpha_png):
-                    remove_alpha_channel(output_png)
-                    self.log(f"Alpha channel extracted to: {output_alpha_png}")
-                else:
-                    self.log(f"No alpha channel found in: {dds_file}")
+    def _decode_one(self, dds_file, fmt, num_threads=1):
+        """
+        Decode a BCn DDS file in-process and split its alpha channel. Runs on a worker thread.
 
-                # Import the PNG(s) into the Substance Painter shelf
-                self.log(f"Converted to: {output_png}")
-                self.import_to_shelf(output_png)
-                if os.path.exists(output_alpha_png):
-                    self.import_to_shelf(output_alpha_png)
+        :param dds_file: Path to the input DDS file
+        :param fmt: Output file format, "tga" or "png"
+        :param num_threads: Threads available to decode a large texture in slabs
+        :return: Same tuple as _process_one
+        """
+        log_lines = [f"Decoded {dds_file} to {fmt.upper()} in-process"]
+        base, _ = os.path.splitext(dds_file)
+        output_image = base + "." + fmt
+        output_alpha_image = base + "_alpha." + fmt
+        try:
+            had_alpha = decode_bcn(dds_file, output_image, output_alpha_image, num_threads)
+        except Exception as e:
+            return dds_file, output_image, None, [], e
+        output_alpha_image = self._describe_split(dds_file, output_image, output_alpha_image, had_alpha, log_lines)
+        return dds_file, output_image, output_alpha_image, log_lines, None
+
+    def _process_one(self, dds_file, output_image, split_alpha=True):
+        """
+        Split the alpha channel of an image produced by texconv. Runs on a worker thread,
+        so log lines are buffered and returned instead of written to the log window.
 
-            except Exception as e:
-                self.log(f"Failed to process {dds_file}: {e}")
-                traceback.print_exc()
+        :param dds_file: Path to the input DDS file
+        :param output_image: Path to the image texconv wrote for it, or None if it wrote nothing
+        :param split_alpha: False to import the image as written, for high bit depth sources
+        :return: Tuple of (dds_file, output_image, output_alpha_image or None, log_lines, exception or None)
+        """
+        log_lines = []
+        try:
+            if not output_image:
+                raise RuntimeError("texconv did not report an output image")
+            if not split_alpha:
+                # Pillow reads 16-bit RGBA PNGs as 8 bits, so any alpha stays in the PNG itself
+                log_lines.append(f"High bit depth source, alpha left in the image: {dds_file}")
+                log_lines.append(f"Converted to: {output_image}")
+                return dds_file, output_image, None, log_lines, None
+            base, ext = os.path.splitext(output_image)
+            output_alpha_image = base + "_alpha" + ext
+
+            # Extract alpha channel if present
+            had_alpha = split_rgba(output_image, output_alpha_image)
+            output_alpha_image = self._describe_split(dds_file, output_image, output_alpha_image, had_alpha, log_lines)
+            return dds_file, output_image, output_alpha_image, log_lines, None
+
+        except Exception as e:
+            return dds_file, output_image, None, log_lines, e
+
+    def _describe_split(self, dds_file, output_image, output_alpha_image, had_alpha, log_lines):
+        """
+        Append the log lines describing an alpha split and return the alpha image to import.
+
+        :return: output_alpha_image if it was written, None otherwise
+        """
+        if had_alpha:
+            log_lines.append(f"Alpha channel extracted to: {output_alpha_image}")
+        elif had_alpha is False:
+            output_alpha_image = None
+            log_lines.append(f"Alpha channel is fully opaque, skipped: {dds_file}")
+        else:
+            output_alpha_image = None
+            log_lines.append(f"No alpha channel found in: {dds_file}")
+        log_lines.append(f"Converted to: {output_image}")
+        return output_alpha_image
 
     def on_import_bc5(self):
         """
@@ -353,8 +837,8 @@ class DDSImporterPlugin:
             return
 
         # Determine the path to the bcdecode executable
-        bcdecode_exe = self.config["Paths"].get("bcdecode", None)
-        if not bcdecode_exe or not os.path.isfile(bcdecode_exe):
+        bcdecode_exe = self._bcdecode_exe
+        if not bcdecode_exe:
             self.log("Invalid or missing bcdecode executable. Please set it using the 'Set bcdecode Location' button.")
             return
 
@@ -369,7 +853,9 @@ class DDSImporterPlugin:
             self.import_to_shelf(out_dds)
 
         except Exception as e:
-            traceback.print_exc()
+            if isinstance(e, FileNotFoundError):
+                self._bcdecode_exe = None
+            self.print_traceback(e)
             self.log(f"Error importing BC5_SNORM DDS: {e}")
             show_message_box("Error Importing BC5_SNORM DDS", str(e))
 
@@ -389,6 +875,20 @@ class DDSImporterPlugin:
         except Exception as e:
             self.log(f"Failed to import {resource_path} to shelf: {e}")
 
+    def import_batch_to_shelf(self, resource_paths):
+        """
+        Import several resources into the Substance Painter shelf in one pass, with
+        repaints of the plugin window held back until every import is done.
+
+        :param resource_paths: Paths to the resource files to import
+        """
+        self.window.setUpdatesEnabled(False)
+        try:
+            for resource_path in resource_paths:
+                self.import_to_shelf(resource_path)
+        finally:
+            self.window.setUpdatesEnabled(True)
+
     def __del__(self):
         """
         Clean up by removing the UI elements when the plugin is destroyed.
@@ -404,6 +904,7 @@ def start_plugin():
     Initialize and start the plugin.
     """
     global PLUGIN_INSTANCE
+    load_qt()
     PLUGIN_INSTANCE = DDSImporterPlugin()
 
 def close_plugin():